@@ -1,8 +1,16 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import sqlite3
 from pathlib import Path
 
+# Fixed Eastern offset used for candle request timestamps
+EST = timezone(timedelta(hours=-5))
+
 class Chronos:
+    # Candle columns loaded by load_market_data by default
+    MARKET_DATA_COLUMNS = ('symbol', 'start', 'end', 'open', 'high', 'low', 'close', 'volume')
+    # Rows per chunk when reading the candles table through pandas
+    READ_CHUNKSIZE = 200_000
+
     def __init__(self, api=None, project_root=None):
         self.api = api
         # Set project root
@@ -13,15 +21,35 @@ class Chronos:
             self.project_root = Path(__file__).parent.parent.resolve()
         
         # Database setup
-        self.db_path = self.project_root / "data" / "symbols.db"
-        self.db_path.parent.mkdir(exist_ok=True)  # Create data directory if it doesn't exist
+        self.data_dir = self.project_root / "data"
+        self.db_path = self.data_dir / "symbols.db"
+        self.market_db_path = self.data_dir / "market_data.db"
+        self.data_dir.mkdir(exist_ok=True)  # Create data directory if it doesn't exist
         self.conn = None
         self.symbol_cache = {}  # Cache for frequently accessed symbols
+        self.symbol_cache_hits = 0  # Number of get_symbol_info calls served from the cache
         
         # Register adapter and converter for datetime
         sqlite3.register_adapter(datetime, lambda dt: dt.isoformat())
         sqlite3.register_converter("TIMESTAMP", lambda b: datetime.fromisoformat(b.decode()))
     
+    @staticmethod
+    def _api_time(dt):
+        """
+        Format a datetime as the timestamp string expected by the candles endpoint.
+        
+        Uses isoformat rather than strftime to skip format-string parsing on every call.
+        
+        Args:
+            dt (datetime): Datetime to format; naive values are taken to be in EST
+        
+        Returns:
+            str: Timestamp such as "2024-01-31T16:00:00.000000-05:00"
+        """
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=EST)
+        return dt.astimezone(EST).replace(microsecond=0).isoformat(timespec='microseconds')
+    
     def _ensure_db_connection(self):
         """Ensures database connection is established"""
         if self.conn is None:
@@ -29,6 +57,8 @@ class Chronos:
             self.conn = sqlite3.connect(str(self.db_path), detect_types=sqlite3.PARSE_DECLTYPES)
             # Enable foreign keys
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # Fire delete triggers for INSERT OR REPLACE so the full-text index stays in sync
+            self.conn.execute("PRAGMA recursive_triggers = ON")
             # Create the table if it doesn't exist
             cursor = self.conn.cursor()
             cursor.execute('''
@@ -80,6 +110,7 @@ class Chronos:
         """Get symbol information from cache, database or API, ensuring consistent return format."""
         # Check cache first
         if symbol_name in self.symbol_cache:
+            self.symbol_cache_hits += 1
             print(f"Symbol {symbol_name} found in cache")
             return self.symbol_cache[symbol_name]
         
@@ -264,16 +295,54 @@ class Chronos:
             # This will get from API and save to DB
             self.get_symbol_info(symbol)
     
-    def search_symbols_in_db(self, search_term):
-        """Search for symbols containing the search term"""
+    def search_symbols_in_db(self, search_term, limit=None, offset=0, full_text=False):
+        """
+        Search for symbols whose symbol or description matches the search term.
+        
+        By default this is a substring match. With full_text=True it uses the symbols_fts
+        index built by optimize_db instead, which is faster on large tables but only matches
+        words starting with the search term; if the index has not been built, the substring
+        match is used.
+        
+        Args:
+            search_term (str): Term to search for
+            limit (int, optional): Maximum number of symbols to return (all matches if None)
+            offset (int): Number of matching symbols to skip, ordered by symbol
+            full_text (bool): Whether to match word prefixes through the full-text index
+        
+        Returns:
+            list: Matching symbols in API format
+        """
         self._ensure_db_connection()
         
+        # SQLite only accepts OFFSET together with LIMIT; -1 means no limit
+        page = (-1 if limit is None else limit, offset)
+        
         with self.conn:
             cursor = self.conn.cursor()
-            cursor.execute('''
-            SELECT * FROM symbols 
-            WHERE symbol LIKE ? OR description LIKE ?
-            ''', (f'%{search_term}%', f'%{search_term}%'))
+            use_like = not full_text
+            if full_text:
+                # Quote the term so FTS5 treats it as a phrase, then match it as a prefix
+                fts_query = '"{}"*'.format(search_term.replace('"', '""'))
+                try:
+                    cursor.execute('''
+                    SELECT s.* FROM symbols s
+                    JOIN symbols_fts f ON s.symbol_id = f.rowid
+                    WHERE symbols_fts MATCH ?
+                    ORDER BY s.symbol
+                    LIMIT ? OFFSET ?
+                    ''', (fts_query, *page))
+                except sqlite3.OperationalError:
+                    # Full-text index not available, scan the table instead
+                    use_like = True
+            
+            if use_like:
+                cursor.execute('''
+                SELECT * FROM symbols 
+                WHERE symbol LIKE ? OR description LIKE ?
+                ORDER BY symbol
+                LIMIT ? OFFSET ?
+                ''', (f'%{search_term}%', f'%{search_term}%', *page))
             
             columns = [desc[0] for desc in cursor.description]
             results = cursor.fetchall()
@@ -310,11 +379,43 @@ class Chronos:
             return stats
     
     def optimize_db(self):
-        """Run VACUUM to optimize the database"""
+        """Rebuild the symbol search index and run VACUUM to optimize the database"""
         self._ensure_db_connection()
+        
+        try:
+            self._build_search_index()
+        except sqlite3.OperationalError as e:
+            # e.g. "no such module: fts5" on SQLite builds without FTS5
+            print(f"Skipping full-text search index: {e}")
+        
         self.conn.execute("VACUUM")
         print("Database optimized")
     
+    def _build_search_index(self):
+        """Create the symbols_fts full-text index and its sync triggers, then rebuild it"""
+        with self.conn:
+            # Full-text index over the symbols table, kept in sync by triggers
+            self.conn.executescript('''
+            CREATE VIRTUAL TABLE IF NOT EXISTS symbols_fts USING fts5(
+                symbol, description, content='symbols', content_rowid='symbol_id'
+            );
+            CREATE TRIGGER IF NOT EXISTS symbols_fts_insert AFTER INSERT ON symbols BEGIN
+                INSERT INTO symbols_fts(rowid, symbol, description)
+                VALUES (new.symbol_id, new.symbol, new.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS symbols_fts_delete AFTER DELETE ON symbols BEGIN
+                INSERT INTO symbols_fts(symbols_fts, rowid, symbol, description)
+                VALUES ('delete', old.symbol_id, old.symbol, old.description);
+            END;
+            CREATE TRIGGER IF NOT EXISTS symbols_fts_update AFTER UPDATE ON symbols BEGIN
+                INSERT INTO symbols_fts(symbols_fts, rowid, symbol, description)
+                VALUES ('delete', old.symbol_id, old.symbol, old.description);
+                INSERT INTO symbols_fts(rowid, symbol, description)
+                VALUES (new.symbol_id, new.symbol, new.description);
+            END;
+            INSERT INTO symbols_fts(symbols_fts) VALUES ('rebuild');
+            ''')
+    
     def clear_symbol_cache(self):
         """Clear the symbol cache"""
         self.symbol_cache = {}
@@ -340,17 +441,13 @@ class Chronos:
         symbol_id = symbol_info['symbolId']
         
         # Get current time for end time
-        end_time = datetime.now()
+        end_time = datetime.now(EST)
         
         # Create the data directory if it doesn't exist
-        data_dir = self.project_root / "data"
-        data_dir.mkdir(exist_ok=True)
-        
-        # Set up market data db path
-        market_db_path = data_dir / "market_data.db"
+        self.data_dir.mkdir(exist_ok=True)
         
         # Connect to the database
-        conn = sqlite3.connect(str(market_db_path))
+        conn = sqlite3.connect(str(self.market_db_path))
         cursor = conn.cursor()
         
         # Create table if it doesn't exist
@@ -424,19 +521,19 @@ class Chronos:
                 should_fetch_api = True
                 # Calculate start time based on requested days
                 start_time = end_time - timedelta(days=days)
-                start_time_str = start_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
+                start_time_str = self._api_time(start_time)
                 print(f"No data exists for {symbol} with interval {interval}. Fetching {days} days of data.")
         else:
             # Force refresh requested, calculate start time based on requested days
             start_time = end_time - timedelta(days=days)
-            start_time_str = start_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
+            start_time_str = self._api_time(start_time)
             print(f"Force refreshing data for {symbol} with interval {interval}. Fetching {days} days of data.")
         
         if should_fetch_api:
             if not self.api:
                 raise ValueError("API instance is required to fetch candle data")
                 
-            end_time_str = end_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
+            end_time_str = self._api_time(end_time)
             
             # Make API call for candles
             candles_response = self.api.get_candles(
@@ -523,17 +620,13 @@ class Chronos:
         symbol_id = symbol_info['symbolId']
         
         # Get current time for end time
-        end_time = datetime.now()
+        end_time = datetime.now(EST)
         
         # Create the data directory if it doesn't exist
-        data_dir = self.project_root / "data"
-        data_dir.mkdir(exist_ok=True)
-        
-        # Set up market data db path
-        market_db_path = data_dir / "market_data.db"
+        self.data_dir.mkdir(exist_ok=True)
         
         # Connect to the database
-        conn = sqlite3.connect(str(market_db_path))
+        conn = sqlite3.connect(str(self.market_db_path))
         cursor = conn.cursor()
         
         # Create table if it doesn't exist
@@ -571,15 +664,15 @@ class Chronos:
             """, (symbol, interval))
             last_end = cursor.fetchone()[0]
             start_time_str = last_end
-            end_time_str = end_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
+            end_time_str = self._api_time(end_time)
             
             print(f"Data exists for {symbol}. Fetching new data since {start_time_str}")
         else:
             # False path - Assign default values
             # Default to getting 90 days of data if nothing exists
             start_time = end_time - timedelta(days=90)
-            start_time_str = start_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
-            end_time_str = end_time.strftime("%Y-%m-%dT%H:%M:%S.000000-05:00")
+            start_time_str = self._api_time(start_time)
+            end_time_str = self._api_time(end_time)
             
             print(f"No data exists for {symbol}. Fetching 90 days of data.")
         
@@ -668,16 +761,13 @@ class Chronos:
         Returns:
             dict: Dictionary with 'candles' key containing the matching candles
         """
-        # Setup market data database path
-        market_db_path = self.project_root / "data" / "market_data.db"
-        
         # Check if database file exists
-        if not market_db_path.exists():
-            print(f"Database file not found at {market_db_path}")
+        if not self.market_db_path.exists():
+            print(f"Database file not found at {self.market_db_path}")
             return {"candles": []}
         
         # Connect to the database
-        conn = sqlite3.connect(str(market_db_path))
+        conn = sqlite3.connect(str(self.market_db_path))
         cursor = conn.cursor()
         
         # Check if the table exists
@@ -737,16 +827,13 @@ class Chronos:
         """
         import pandas as pd
         
-        # Set up market data db path
-        market_db_path = self.project_root / "data" / "market_data.db"
-        
         # Check if database file exists
-        if not market_db_path.exists():
-            print(f"Database file not found at {market_db_path}")
+        if not self.market_db_path.exists():
+            print(f"Database file not found at {self.market_db_path}")
             return pd.DataFrame() if as_dataframe else {"candles": []}
         
         # Connect to the database
-        conn = sqlite3.connect(str(market_db_path))
+        conn = sqlite3.connect(str(self.market_db_path))
         cursor = conn.cursor()
         
         # Check if the table exists
@@ -756,19 +843,14 @@ class Chronos:
             conn.close()
             return pd.DataFrame() if as_dataframe else {"candles": []}
         
+        query = "SELECT * FROM candles ORDER BY symbol, start"
+        
         try:
-            # Retrieve all candles sorted by symbol and start time
-            cursor.execute("""
-                SELECT * FROM candles
-                ORDER BY symbol, start
-            """)
-            
-            columns = [description[0] for description in cursor.description]
-            all_candles_data = cursor.fetchall()
-            
             if as_dataframe:
-                # Convert to pandas DataFrame
-                df = pd.DataFrame(all_candles_data, columns=columns)
+                # Build the DataFrame chunk by chunk so the raw row tuples never
+                # coexist with the full frame in memory
+                chunks = pd.read_sql_query(query, conn, chunksize=self.READ_CHUNKSIZE)
+                df = pd.concat(chunks, ignore_index=True)
                 
                 # Convert date columns to datetime if DataFrame is not empty
                 if not df.empty:
@@ -807,21 +889,160 @@ class Chronos:
                 print(f"Retrieved {len(df)} total candles across all symbols")
                 return df
             else:
-                # Convert to dictionary format
+                # Convert to dictionary format, fetching rows in batches
+                conn.row_factory = sqlite3.Row
+                cursor = conn.cursor()
+                cursor.arraysize = 10_000
+                cursor.execute(query)
+                
                 all_candles = []
-                for row in all_candles_data:
-                    candle_dict = {columns[i]: row[i] for i in range(len(columns))}
-                    all_candles.append(candle_dict)
+                rows = cursor.fetchmany()
+                while rows:
+                    all_candles.extend(dict(row) for row in rows)
+                    rows = cursor.fetchmany()
                 
                 print(f"Retrieved {len(all_candles)} total candles across all symbols")
                 return {"candles": all_candles}
         
-        except sqlite3.Error as e:
+        except (sqlite3.Error, pd.io.sql.DatabaseError) as e:
             print(f"Database error: {e}")
             return pd.DataFrame() if as_dataframe else {"candles": []}
         finally:
             conn.close()
 
+    def _market_data_query(self, columns, interval=None, table='candles'):
+        """
+        Build the SELECT used to load candles, optionally limited to one interval.
+        
+        Args:
+            columns (list): Columns to select
+            interval (str, optional): Only select candles of this interval
+            table (str): Name of the candles table as seen by the reader
+        
+        Returns:
+            tuple: (query, parameters)
+        """
+        column_list = ', '.join(f'"{col}"' for col in columns)
+        query = f"SELECT {column_list} FROM {table}"
+        params = []
+        if interval is not None:
+            query += " WHERE interval = ?"
+            params.append(interval)
+        return f"{query} ORDER BY symbol, start", params
+
+    def _fetch_market_data_arrow(self, columns, interval=None):
+        """
+        Fetch the candles table as a pyarrow.Table, sorted by symbol and start time.
+        
+        DuckDB (through its sqlite extension) is tried first, then adbc_driver_sqlite.
+        Note that DuckDB downloads its sqlite extension on first use if it is not
+        already installed, so the first call may need network access.
+        
+        Args:
+            columns (list): Columns to fetch
+            interval (str, optional): Only fetch candles of this interval
+        
+        Returns:
+            pyarrow.Table or None: None if neither reader is available or both fail
+        """
+        
+        try:
+            import duckdb
+        except ImportError:
+            duckdb = None
+        
+        if duckdb is not None:
+            db_path = str(self.market_db_path).replace("'", "''")
+            try:
+                con = duckdb.connect()
+                try:
+                    # INSTALL fetches the extension from DuckDB's repository if missing
+                    con.execute("INSTALL sqlite; LOAD sqlite;")
+                    con.execute(f"ATTACH '{db_path}' AS md (TYPE SQLITE, READ_ONLY)")
+                    query, params = self._market_data_query(columns, interval, table='md.candles')
+                    return con.execute(query, params).fetch_arrow_table()
+                finally:
+                    con.close()
+            except duckdb.Error as e:
+                # Most likely the sqlite extension could not be installed
+                print(f"DuckDB could not read the database, trying ADBC: {e}")
+        
+        try:
+            import adbc_driver_sqlite.dbapi as adbc
+        except ImportError:
+            return None
+        
+        try:
+            with adbc.connect(str(self.market_db_path)) as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute(*self._market_data_query(columns, interval))
+                    return cursor.fetch_arrow_table()
+        except Exception as e:
+            print(f"ADBC could not read the database, falling back to pandas: {e}")
+            return None
+
+    def load_market_data(self, columns=None, interval=None):
+        """
+        Loads all market data (candles) from the local database through Apache Arrow.
+
+        The candles are fetched column-wise with DuckDB or adbc_driver_sqlite and handed
+        to pandas as Arrow-backed columns, so no per-cell Python objects are created. If
+        neither is installed (pip install questrade-custom-api[arrow]) or the Arrow read
+        fails, the table is read in chunks with pandas instead.
+
+        The candles table holds every interval that was fetched, so pass interval to
+        get a single regular series per symbol.
+
+        Args:
+            columns (list, optional): Columns to load. Defaults to MARKET_DATA_COLUMNS.
+            interval (str, optional): Only load candles of this interval (e.g. 'OneDay').
+                                      Defaults to all intervals.
+
+        Returns:
+            pandas.DataFrame: Candle data sorted by symbol and start time, with the
+                              'start' and 'end' columns as timezone-naive UTC datetimes
+        """
+        import pandas as pd
+
+        columns = list(columns or self.MARKET_DATA_COLUMNS)
+
+        # Check if database file exists
+        if not self.market_db_path.exists():
+            print(f"Database file not found at {self.market_db_path}")
+            return pd.DataFrame(columns=columns)
+
+        df = None
+        try:
+            table = self._fetch_market_data_arrow(columns, interval)
+            if table is not None:
+                df = table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True)
+        except Exception as e:
+            # e.g. pyarrow missing or pandas too old for ArrowDtype
+            print(f"Arrow read failed, falling back to pandas: {e}")
+
+        if df is None:
+            try:
+                query, params = self._market_data_query(columns, interval)
+                conn = sqlite3.connect(str(self.market_db_path))
+                try:
+                    chunks = pd.read_sql_query(query, conn, params=params,
+                                               chunksize=self.READ_CHUNKSIZE)
+                    df = pd.concat(chunks, ignore_index=True)
+                finally:
+                    conn.close()
+            except Exception as e:
+                print(f"Database error: {e}")
+                return pd.DataFrame(columns=columns)
+
+        # Timestamps are stored as ISO strings with an offset; TimeSeriesDataFrame
+        # expects timezone-naive datetimes
+        for date_col in ('start', 'end'):
+            if date_col in df.columns:
+                df[date_col] = pd.to_datetime(df[date_col], utc=True).dt.tz_localize(None)
+
+        print(f"Loaded {len(df)} total candles across all symbols")
+        return df
+
     def __del__(self):
         """Ensure database connection is closed when object is destroyed"""
         if hasattr(self, 'conn') and self.conn is not None:
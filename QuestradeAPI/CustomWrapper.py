@@ -1,9 +1,16 @@
 import os
 import json
+import hashlib
+import inspect
 import requests
+import threading
 import time
+from datetime import timedelta
+from functools import wraps
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Import our rate limiter
 from .RateLimiter import RateLimiter, ApiCategory
@@ -82,6 +89,9 @@ def retry_with_new_token(method):
         retry_count = 0
         
         while retry_count <= max_retries:
+            # Remember which token this attempt used, so a refresh already done by
+            # another thread or clone is not repeated
+            access_token = self.access_token
             try:
                 # Try the original method
                 return method(self, *args, **kwargs)
@@ -91,7 +101,7 @@ def retry_with_new_token(method):
                     if retry_count < max_retries:
                         # Re-initialize the API connection
                         print("API token expired. Refreshing token and retrying...")
-                        if self.authenticate():
+                        if self._reauthenticate(access_token):
                             retry_count += 1
                             continue  # Try again with the new token
                         else:
@@ -109,14 +119,110 @@ def retry_with_new_token(method):
     return wrapper
 
 
+def file_cache(ttl: timedelta):
+    """
+    Decorator that caches a method's JSON response on disk for the given time-to-live.
+    
+    Caching is opt-in: it only applies when the instance was created with a cache_dir.
+    Responses are stored as <cache_dir>/<method name>/<md5 of arguments>.json together
+    with the time they were fetched, and are re-fetched once older than ttl. Arguments
+    are bound to the method's signature first, so positional, keyword and defaulted
+    arguments share one entry.
+    
+    Args:
+        ttl: How long a cached response stays valid
+    """
+    ttl_seconds = ttl.total_seconds()
+    
+    def decorator(method):
+        signature = inspect.signature(method)
+        
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if self.cache_dir is None:
+                return method(self, *args, **kwargs)
+            
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = list(bound.arguments.items())[1:]  # Drop self
+            key = hashlib.md5(repr(arguments).encode()).hexdigest()
+            cache_file = self.cache_dir / method.__name__ / f"{key}.json"
+            
+            try:
+                with open(cache_file, 'r') as f:
+                    cached = json.load(f)
+                if time.time() - cached['_cached_at'] < ttl_seconds:
+                    return cached['data']
+            except (OSError, KeyError, TypeError, json.JSONDecodeError):
+                pass  # Missing or unreadable entry, fetch a fresh copy
+            
+            result = method(self, *args, **kwargs)
+            
+            try:
+                cache_file.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temporary file first so readers never see a partial entry
+                tmp_file = cache_file.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp_file, 'w') as f:
+                    json.dump({'_cached_at': time.time(), 'data': result}, f)
+                os.replace(tmp_file, cache_file)
+            except OSError as e:
+                print(f"Warning: could not write cache entry {cache_file}: {e}")
+            
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+class _AuthState:
+    """
+    Authentication state shared by a QuestradeAPI client and its clones.
+    
+    Questrade refresh tokens can only be used once, so every instance and thread
+    that talks to the same account must see the latest token. The lock serialises
+    token refreshes.
+    """
+    
+    def __init__(self, refresh_token: Optional[str] = None):
+        self.refresh_token = refresh_token
+        self.api_server = None
+        self.access_token = None
+        self.token_type = None
+        self.expires_in = None
+        # Set by invalidate_token() to re-authenticate lazily on the next request
+        self.needs_reauth = False
+        self.lock = threading.RLock()
+
+
+def _auth_property(name: str, doc: str) -> property:
+    """Expose an attribute of the shared _AuthState as an attribute of the client."""
+    return property(
+        lambda self: getattr(self._auth, name),
+        lambda self, value: setattr(self._auth, name, value),
+        doc=doc
+    )
+
+
 class QuestradeAPI:
     """
     A custom wrapper for the Questrade API that handles authentication and provides
     methods for common API operations.
+    
+    A client can be shared between threads: token refreshes are serialised and a
+    token refreshed by one caller is reused by the others.
     """
     
+    refresh_token = _auth_property('refresh_token', "Refresh token used for the next authentication")
+    api_server = _auth_property('api_server', "API server URL returned by authentication")
+    access_token = _auth_property('access_token', "Current access token")
+    token_type = _auth_property('token_type', "Token type for the Authorization header")
+    expires_in = _auth_property('expires_in', "Access token lifetime in seconds")
+    _needs_reauth = _auth_property('needs_reauth', "Whether the next request must re-authenticate first")
+    
     def __init__(self, refresh_token: Optional[str] = None, token_path: Optional[str] = None, 
-                 max_retries: int = 3, enforce_rate_limit: bool = True):
+                 max_retries: int = 3, enforce_rate_limit: bool = True,
+                 cache_dir: Optional[str] = None):
         """
         Initialize the Questrade API wrapper.
         
@@ -125,8 +231,11 @@ class QuestradeAPI:
             token_path: Optional custom path to the token file
             max_retries: Maximum number of retries when hitting rate limits
             enforce_rate_limit: Whether to enforce rate limits and wait if needed
+            cache_dir: Optional directory for caching reference data responses on disk
+                       (e.g. ".cache/questrade"). Caching is disabled when not provided.
         """
-        self.refresh_token = refresh_token
+        self._auth = _AuthState(refresh_token)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         
         # Set default token path if not provided
         if token_path is None:
@@ -135,18 +244,22 @@ class QuestradeAPI:
             self.token_path = os.path.join(project_root, 'secrets', 'questrade_token.json')
         else:
             self.token_path = token_path
-            
-        # Initialize API connection properties
-        self.api_server = None
-        self.access_token = None
-        self.token_type = None
-        self.expires_in = None
         
         # Initialize rate limiting
         self.rate_limiter = RateLimiter()
         self.max_retries = max_retries
         self.enforce_rate_limit = enforce_rate_limit
         
+        # Reuse TCP/TLS connections across requests; only connection failures are
+        # retried at this level, rate limits and API errors are handled in _make_request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, connect=3, read=0, backoff_factor=0.5)
+        )
+        self.session.mount('https://', adapter)
+        
         # Authenticate on initialization
         self.authenticate()
     
@@ -154,58 +267,146 @@ class QuestradeAPI:
         """
         Authenticate with the Questrade API using the refresh token.
         
+        Refreshes are serialised across threads and clones sharing this client's
+        authentication state.
+        
         Returns:
             bool: True if authentication was successful, False otherwise
         """
-        # If no refresh token provided, try to read from file
-        if self.refresh_token is None:
-            if os.path.exists(self.token_path):
-                try:
-                    with open(self.token_path, 'r') as f:
-                        token_data = json.load(f)
-                    self.refresh_token = token_data['refresh_token']
-                except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
-                    print(f"Error reading token file: {e}")
-                    return False
-            else:
-                # Prompt user for refresh token if file doesn't exist
-                self.refresh_token = input("Please enter your Questrade refresh token: ")
-                if not self.refresh_token:
-                    print("No refresh token provided")
-                    return False
-        
-        # Get new token
-        url = f"https://login.questrade.com/oauth2/token?grant_type=refresh_token&refresh_token={self.refresh_token}"
-        response = requests.get(url)
-        
-        if response.status_code != 200:
-            print(f"Authentication failed: {response.text}")
-            # Clear the invalid refresh token so user will be prompted on next attempt
-            self.refresh_token = None
-            if os.path.exists(self.token_path):
-                try:
-                    os.remove(self.token_path)
-                    print("Removed invalid token file. Please provide a new refresh token.")
-                except:
-                    pass
-            return False
+        with self._auth.lock:
+            # If no refresh token provided, try to read from file
+            if self.refresh_token is None:
+                if os.path.exists(self.token_path):
+                    self.refresh_token = self._read_token_file()
+                    if self.refresh_token is None:
+                        return False
+                else:
+                    # Prompt user for refresh token if file doesn't exist
+                    self.refresh_token = input("Please enter your Questrade refresh token: ")
+                    if not self.refresh_token:
+                        print("No refresh token provided")
+                        return False
+            
+            response = self._request_token(self.refresh_token)
+            
+            if response.status_code != 200:
+                # Refresh tokens are single-use; another process may already have used
+                # ours and saved its replacement, so try the token on file first
+                saved_token = self._read_token_file() if os.path.exists(self.token_path) else None
+                if saved_token and saved_token != self.refresh_token:
+                    self.refresh_token = saved_token
+                    response = self._request_token(saved_token)
             
-        response_json = response.json()
+            if response.status_code != 200:
+                print(f"Authentication failed: {response.text}")
+                failed_token = self.refresh_token
+                # Clear the invalid refresh token so user will be prompted on next attempt
+                self.refresh_token = None
+                # Only remove the token file if it still holds the token that failed
+                if os.path.exists(self.token_path) and self._read_token_file() == failed_token:
+                    try:
+                        os.remove(self.token_path)
+                        print("Removed invalid token file. Please provide a new refresh token.")
+                    except:
+                        pass
+                return False
+                
+            response_json = response.json()
+            
+            # Update the shared authentication state
+            self.api_server = response_json['api_server']
+            self.access_token = response_json['access_token']
+            self.token_type = response_json['token_type']
+            self.expires_in = response_json['expires_in']
+            self.refresh_token = response_json['refresh_token']
+            self._needs_reauth = False
+            
+            # Save the new refresh token
+            # Create directory if it doesn't exist
+            os.makedirs(os.path.dirname(self.token_path), exist_ok=True)
+            with open(self.token_path, 'w') as f:
+                json.dump({'refresh_token': self.refresh_token}, f)
+            
+            return True
+    
+    def _request_token(self, refresh_token: str):
+        """
+        Exchange a refresh token for a new access token.
+        
+        Args:
+            refresh_token: Refresh token to exchange
+            
+        Returns:
+            Response object from requests
+        """
+        url = f"https://login.questrade.com/oauth2/token?grant_type=refresh_token&refresh_token={refresh_token}"
+        return self.session.get(url)
+    
+    def _read_token_file(self) -> Optional[str]:
+        """
+        Read the refresh token saved at token_path.
+        
+        Returns:
+            str: The saved refresh token, or None if the file cannot be read
+        """
+        try:
+            with open(self.token_path, 'r') as f:
+                token_data = json.load(f)
+            return token_data['refresh_token']
+        except (FileNotFoundError, KeyError, TypeError, json.JSONDecodeError) as e:
+            print(f"Error reading token file: {e}")
+            return None
+    
+    def _reauthenticate(self, stale_access_token: Optional[str]) -> bool:
+        """
+        Refresh the access token unless another caller already replaced it.
+        
+        Args:
+            stale_access_token: The access token the failed or pending request used
+            
+        Returns:
+            bool: True if a valid access token is available
+        """
+        with self._auth.lock:
+            # Another thread or clone may have refreshed while we waited for the lock
+            if self.access_token and self.access_token != stale_access_token and not self._needs_reauth:
+                return True
+            return self.authenticate()
+    
+    def clone(self, **overrides) -> 'QuestradeAPI':
+        """
+        Create a copy of this client that reuses its authenticated state.
         
-        # Update instance properties
-        self.api_server = response_json['api_server']
-        self.access_token = response_json['access_token']
-        self.token_type = response_json['token_type']
-        self.expires_in = response_json['expires_in']
-        self.refresh_token = response_json['refresh_token']
+        No token exchange is made, so this is much cheaper than constructing a new
+        QuestradeAPI. The copy shares the HTTP session, rate limiter and authentication
+        state with this instance, so a token refreshed by either one is used by both.
+        
+        Args:
+            **overrides: Existing attributes to change on the copy (e.g. enforce_rate_limit=False)
+            
+        Returns:
+            QuestradeAPI: The new client
+            
+        Raises:
+            TypeError: If an override does not name an existing attribute
+        """
+        unknown = set(overrides) - set(self.__dict__)
+        if unknown:
+            raise TypeError(f"clone() got unexpected attribute(s): {', '.join(sorted(unknown))}")
+        if overrides.get('cache_dir') is not None:
+            overrides['cache_dir'] = Path(overrides['cache_dir'])
         
-        # Save the new refresh token
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(self.token_path), exist_ok=True)
-        with open(self.token_path, 'w') as f:
-            json.dump({'refresh_token': self.refresh_token}, f)
+        client = object.__new__(type(self))
+        client.__dict__ = {**self.__dict__, **overrides}
+        return client
+    
+    def invalidate_token(self):
+        """
+        Mark the current access token as stale.
         
-        return True
+        No request is made here; the next API call re-authenticates before it is sent.
+        """
+        self._needs_reauth = True
     
     def _parse_rate_limit_headers(self, response, category):
         """
@@ -230,7 +431,8 @@ class QuestradeAPI:
     
     @retry_with_new_token
     def _make_request(self, endpoint: str, method: str = 'GET', params: Optional[Dict] = None, 
-                     data: Optional[Dict] = None, retry_count: int = 0) -> Dict:
+                     data: Optional[Dict] = None, retry_count: int = 0,
+                     category: Optional[ApiCategory] = None, parse_json: bool = True) -> Optional[Dict]:
         """
         Make a request to the Questrade API.
         
@@ -240,9 +442,13 @@ class QuestradeAPI:
             params: Optional query parameters
             data: Optional data for POST requests
             retry_count: Current retry attempt (used internally for recursion)
+            category: Rate limit category of the endpoint. Public methods pass it
+                      explicitly; when omitted it is derived from the endpoint.
+            parse_json: Whether to decode the response body. When False, the request is
+                        still checked for errors but None is returned.
             
         Returns:
-            Dict: JSON response from the API
+            Dict: JSON response from the API, or None if parse_json is False
             
         Raises:
             QuestradeGeneralError: For general API errors
@@ -251,12 +457,14 @@ class QuestradeAPI:
             requests.exceptions.RequestException: For network-related errors
         """
         # Ensure we have a valid token
-        if not self.access_token or not self.api_server:
-            if not self.authenticate():
+        access_token = self.access_token
+        if self._needs_reauth or not access_token or not self.api_server:
+            if not self._reauthenticate(access_token):
                 raise QuestradeGeneralError("1000", "Authentication failed", None)
         
         # Get the API category for rate limiting
-        category = self.rate_limiter.get_category_for_endpoint(endpoint)
+        if category is None:
+            category = self.rate_limiter.get_category_for_endpoint(endpoint)
         
         # Check if we need to wait for rate limiting
         if self.enforce_rate_limit:
@@ -265,7 +473,7 @@ class QuestradeAPI:
                 if retry_count < self.max_retries:
                     # Sleep and retry
                     time.sleep(wait_time)
-                    return self._make_request(endpoint, method, params, data, retry_count + 1)
+                    return self._make_request(endpoint, method, params, data, retry_count + 1, category, parse_json)
                 else:
                     # We've reached the maximum number of retries
                     raise QuestradeRateLimitError(
@@ -283,40 +491,50 @@ class QuestradeAPI:
         
         # Make the request
         try:
+            method = method.upper()
+            if method not in ('GET', 'POST', 'PUT', 'DELETE'):
+                raise ValueError(f"Unsupported HTTP method: {method}")
+            
+            # Only POST and PUT carry a JSON body
+            body = data if method in ('POST', 'PUT') else None
+            if body is not None:
+                headers['Content-Type'] = 'application/json'
+            
             # Record this request for rate limiting
             self.rate_limiter.record_request(category)
             
-            if method.upper() == 'GET':
-                response = requests.get(url, headers=headers, params=params)
-            elif method.upper() == 'POST':
-                headers['Content-Type'] = 'application/json'
-                response = requests.post(url, headers=headers, params=params, json=data)
-            elif method.upper() == 'PUT':
-                headers['Content-Type'] = 'application/json'
-                response = requests.put(url, headers=headers, params=params, json=data)
-            elif method.upper() == 'DELETE':
-                response = requests.delete(url, headers=headers, params=params)
-            else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+            response = self.session.request(method, url, headers=headers, params=params, json=body)
             
             # Parse rate limit headers to update our rate limiter
             self._parse_rate_limit_headers(response, category)
             
             # Handle rate limit exceeded
             if response.status_code == 429:
-                retry_after = response.headers.get('X-RateLimit-Reset')
                 retry_seconds = None
+                # Prefer an explicit Retry-After (seconds), otherwise wait for the window reset
+                retry_after = response.headers.get('Retry-After')
                 if retry_after:
                     try:
-                        retry_seconds = float(retry_after) - time.time()
-                        retry_seconds = max(0, retry_seconds)
+                        retry_seconds = max(0, float(retry_after))
                     except (ValueError, TypeError):
-                        retry_seconds = 1.0  # Default to 1 second if we can't parse
+                        retry_after = None
+                if not retry_after:
+                    retry_after = response.headers.get('X-RateLimit-Reset')
+                    if retry_after:
+                        try:
+                            retry_seconds = float(retry_after) - time.time()
+                            retry_seconds = max(0, retry_seconds)
+                        except (ValueError, TypeError):
+                            retry_seconds = 1.0  # Default to 1 second if we can't parse
+                
+                # Stop every request in this category until the server is ready again
+                if retry_seconds is not None:
+                    self.rate_limiter.penalize(category, retry_seconds)
                 
                 if retry_count < self.max_retries and retry_seconds is not None:
                     # Sleep and retry
                     time.sleep(retry_seconds)
-                    return self._make_request(endpoint, method, params, data, retry_count + 1)
+                    return self._make_request(endpoint, method, params, data, retry_count + 1, category, parse_json)
                 else:
                     # We've reached the maximum number of retries
                     raise QuestradeRateLimitError(
@@ -348,15 +566,17 @@ class QuestradeAPI:
                         raise QuestradeGeneralError("1021", f"Unexpected error: {response.text}", response.status_code)
             
             # If we get here, the request was successful
+            if not parse_json:
+                return None
             return response.json()
             
         except requests.exceptions.HTTPError as e:
             # If we get a 401, try to re-authenticate once
             response = e.response
             if response.status_code == 401:
-                if self.authenticate():
+                if self._reauthenticate(access_token):
                     # Retry the request with the new token
-                    return self._make_request(endpoint, method, params, data, retry_count)
+                    return self._make_request(endpoint, method, params, data, retry_count, category, parse_json)
                 else:
                     # Authentication failed
                     raise QuestradeGeneralError("1017", "Access token is invalid", 401)
@@ -440,7 +660,7 @@ class QuestradeAPI:
                     isBilling (bool): Whether this is the billing account
                     clientAccountType (str): Client account type
         """
-        return self._make_request('v1/accounts')
+        return self._make_request('v1/accounts', category=ApiCategory.ACCOUNT)
     
     def get_account_positions(self, account_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Get positions for a specific account.
@@ -464,7 +684,7 @@ class QuestradeAPI:
                     isRealTime (bool): If real-time quote used for PnL
                     isUnderReorg (bool): If symbol undergoing reorganization
         """
-        return self._make_request(f'v1/accounts/{account_id}/positions')
+        return self._make_request(f'v1/accounts/{account_id}/positions', category=ApiCategory.ACCOUNT)
     
     def get_account_balances(self, account_id: str) -> Dict[str, Dict[str, Any]]:
         """Get balances for a specific account.
@@ -493,7 +713,7 @@ class QuestradeAPI:
                 sodPerCurrencyBalances (List[Dict]): Start-of-day balances per currency
                 sodCombinedBalances (List[Dict]): Start-of-day combined balances
         """
-        return self._make_request(f'v1/accounts/{account_id}/balances')
+        return self._make_request(f'v1/accounts/{account_id}/balances', category=ApiCategory.ACCOUNT)
     
     def get_account_executions(self, account_id: str, start_time: Optional[str] = None, 
                               end_time: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -533,7 +753,7 @@ class QuestradeAPI:
         if end_time:
             params['endTime'] = end_time
         
-        return self._make_request(f'v1/accounts/{account_id}/executions', params=params)
+        return self._make_request(f'v1/accounts/{account_id}/executions', params=params, category=ApiCategory.ACCOUNT)
     
     def get_account_orders(self, account_id: str, start_time: Optional[str] = None, 
                           end_time: Optional[str] = None, state: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -600,7 +820,7 @@ class QuestradeAPI:
         if state:
             params['stateFilter'] = state
         
-        return self._make_request(f'v1/accounts/{account_id}/orders', params=params)
+        return self._make_request(f'v1/accounts/{account_id}/orders', params=params, category=ApiCategory.ACCOUNT)
     
     # Market data endpoints
     def get_symbols(self, symbols: List[str] = None, symbol_names: List[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -667,8 +887,9 @@ class QuestradeAPI:
         if symbol_names:
             params['names'] = ','.join(symbol_names)
             
-        return self._make_request('v1/symbols', params=params)
+        return self._make_request('v1/symbols', params=params, category=ApiCategory.MARKET)
     
+    @file_cache(ttl=timedelta(days=7))
     def search_symbols(self, prefix: str, offset: int = 0) -> Dict[str, List[Dict[str, Any]]]:
         """Search for symbols by prefix.
         
@@ -688,8 +909,9 @@ class QuestradeAPI:
                     isTradable (bool): Whether the symbol is tradable
                     currency (str): Currency of the symbol
         """
-        return self._make_request('v1/symbols/search', params={'prefix': prefix, 'offset': offset})
+        return self._make_request('v1/symbols/search', params={'prefix': prefix, 'offset': offset}, category=ApiCategory.MARKET)
     
+    @file_cache(ttl=timedelta(days=7))
     def get_symbol_options(self, symbol_id: str) -> Dict:
         """Get option chain for a symbol.
         
@@ -710,8 +932,9 @@ class QuestradeAPI:
                             callSymbolId (int): Internal identifier of the call option
                             putSymbolId (int): Internal identifier of the put option
         """
-        return self._make_request(f'v1/symbols/{symbol_id}/options')
+        return self._make_request(f'v1/symbols/{symbol_id}/options', category=ApiCategory.MARKET)
     
+    @file_cache(ttl=timedelta(days=30))
     def get_markets(self) -> Dict[str, List[Dict[str, Any]]]:
         """Get information about supported markets.
         
@@ -732,7 +955,7 @@ class QuestradeAPI:
                     currency (str): Currency code (ISO format)
                     snapQuotesLimit (int): Number of snap quotes that can be retrieved
         """
-        return self._make_request('v1/markets')
+        return self._make_request('v1/markets', category=ApiCategory.MARKET)
     
     def get_quotes(self, symbol_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """Get real-time or delayed quotes for a list of symbols.
@@ -766,8 +989,9 @@ class QuestradeAPI:
                     isHalted (bool): Whether trading is halted
         """
         ids = ','.join(map(str, symbol_ids))
-        return self._make_request('v1/markets/quotes', params={'ids': ids})
+        return self._make_request('v1/markets/quotes', params={'ids': ids}, category=ApiCategory.MARKET)
     
+    @file_cache(ttl=timedelta(seconds=60))
     def get_candles(self, symbol_id: str, start_time: str, end_time: str, 
                    interval: str = 'OneDay') -> Dict[str, Any]:
         """
@@ -806,7 +1030,7 @@ class QuestradeAPI:
             'endTime': end_time,
             'interval': interval
         }
-        return self._make_request(f'v1/markets/candles/{symbol_id}', params=params)
+        return self._make_request(f'v1/markets/candles/{symbol_id}', params=params, category=ApiCategory.MARKET)
     
     def get_account_activities(self, account_id: str, start_time: Optional[str] = None, 
                               end_time: Optional[str] = None) -> Dict[str, List[Dict[str, Any]]]:
@@ -853,17 +1077,23 @@ class QuestradeAPI:
                 end_time = end_time.split('.')[0] + ".000000-05:00"
             params['endTime'] = end_time
         
-        return self._make_request(f'v1/accounts/{account_id}/activities', params=params)
+        return self._make_request(f'v1/accounts/{account_id}/activities', params=params, category=ApiCategory.ACCOUNT)
     
-    def get_time(self) -> Dict[str, str]:
+    def get_time(self, parse_json: bool = True) -> Optional[Dict[str, str]]:
         """Get current server time.
         
+        Args:
+            parse_json (bool, optional): Set to False to skip decoding the response when
+                                         only success or failure matters (e.g. connectivity checks)
+        
         Returns:
             Dict containing:
                 time (str): Current server time in ISO format
+            or None if parse_json is False
         """
-        return self._make_request('v1/time')
+        return self._make_request('v1/time', category=ApiCategory.ACCOUNT, parse_json=parse_json)
     
+    @file_cache(ttl=timedelta(days=7))
     def get_symbol(self, symbol_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Get detailed information about a specific symbol.
         
@@ -907,8 +1137,9 @@ class QuestradeAPI:
                     industryGroup (str): Industry group classification
                     industrySubGroup (str): Industry subgroup classification
         """
-        return self._make_request(f'v1/symbols/{symbol_id}')
+        return self._make_request(f'v1/symbols/{symbol_id}', category=ApiCategory.MARKET)
     
+    @file_cache(ttl=timedelta(seconds=60))
     def get_quote(self, symbol_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Get real-time or delayed quote for a single symbol.
         
@@ -937,7 +1168,7 @@ class QuestradeAPI:
                     delay (bool): Whether quote is delayed vs real-time
                     isHalted (bool): Whether trading is halted
         """
-        return self._make_request(f'v1/markets/quotes/{symbol_id}')
+        return self._make_request(f'v1/markets/quotes/{symbol_id}', category=ApiCategory.MARKET)
     
     def get_option_quotes(self, option_ids: List[str]) -> Dict[str, List[Dict[str, Any]]]:
         """Get quotes for a list of option symbols.
@@ -975,7 +1206,7 @@ class QuestradeAPI:
                     VWAP (float): Volume weighted average price
         """
         ids = ','.join(map(str, option_ids))
-        return self._make_request('v1/markets/quotes/options', params={'optionIds': ids})
+        return self._make_request('v1/markets/quotes/options', params={'optionIds': ids}, category=ApiCategory.MARKET)
     
     def get_strategy_quotes(self, variant_id: str) -> Dict[str, List[Dict[str, Any]]]:
         """Get quotes for a strategy (multi-leg orders).
@@ -987,5 +1218,5 @@ class QuestradeAPI:
             Dict containing:
                 quotes (List[Dict]): List of strategy quote records
         """
-        return self._make_request('v1/markets/quotes/strategies', params={'variantId': variant_id})
+        return self._make_request('v1/markets/quotes/strategies', params={'variantId': variant_id}, category=ApiCategory.MARKET)
     
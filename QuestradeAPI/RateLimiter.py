@@ -8,6 +8,7 @@ It tracks requests across different API categories and ensures limits are not ex
 import time
 import threading
 from enum import Enum
+from itertools import repeat
 from typing import Dict, Optional
 from collections import deque
 
@@ -18,6 +19,70 @@ class ApiCategory(Enum):
     MARKET = "market"      # Market data calls
 
 
+class TokenBucket:
+    """
+    Token bucket that refills continuously at a fixed rate up to a maximum capacity.
+    
+    Each request takes a token; when the bucket is empty the caller is told how long
+    to wait instead of firing a request the server will reject. A server-imposed
+    back-off (e.g. a Retry-After header) empties the bucket and holds off refilling
+    until it has elapsed.
+    """
+    
+    def __init__(self, capacity: float, rate: float):
+        """
+        Initialize a full token bucket.
+        
+        Args:
+            capacity: Maximum number of tokens the bucket can hold (burst size)
+            rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self, cost: float = 1) -> float:
+        """
+        Try to take tokens from the bucket.
+        
+        Args:
+            cost: Number of tokens to take
+            
+        Returns:
+            float: 0 if the tokens were taken, otherwise the number of seconds to wait
+                   before trying again (no tokens are taken in that case)
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._last:
+                # Still inside a server-imposed back-off
+                return self._last - now + max(0.0, cost - self._tokens) / self.rate
+            
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            
+            if self._tokens >= cost:
+                self._tokens -= cost
+                return 0
+            return (cost - self._tokens) / self.rate
+    
+    def penalize(self, retry_after: float):
+        """
+        Drain the bucket and delay refilling after the server rejected a request.
+        
+        A single token is left for when the back-off ends, so a retry made after
+        waiting Retry-After goes out immediately instead of waiting another refill.
+        
+        Args:
+            retry_after: Seconds the server asked us to wait before retrying
+        """
+        with self._lock:
+            self._tokens = min(self.capacity, 1.0)
+            self._last = max(self._last, time.monotonic() + retry_after)
+
+
 class RateLimiter:
     """
     Rate limiter for Questrade API that enforces per-second and per-hour limits.
@@ -53,6 +118,12 @@ class RateLimiter:
             ApiCategory.MARKET: self.RATE_LIMITS[ApiCategory.MARKET][0]
         }
         
+        # Token bucket per category, sized to the per-second limit
+        self._buckets: Dict[ApiCategory, TokenBucket] = {
+            category: TokenBucket(capacity=limits[0], rate=limits[0])
+            for category, limits in self.RATE_LIMITS.items()
+        }
+        
         # Track when limits reset (Unix timestamp)
         self._reset_time: Dict[ApiCategory, float] = {
             ApiCategory.ACCOUNT: time.time() + 1,  # 1 second default
@@ -72,24 +143,60 @@ class RateLimiter:
             self._remaining[category] = remaining
             self._reset_time[category] = reset_time
     
-    def record_request(self, category: ApiCategory):
+    def record_request(self, category: ApiCategory, timestamp: Optional[float] = None):
         """
         Record that an API request was made for the specified category.
         
         Args:
             category: The API category the request belongs to
+            timestamp: Unix timestamp to record (defaults to the current time). Pass a
+                       value read once outside a loop to avoid a clock read per request.
         """
-        current_time = time.time()
+        current_time = time.time() if timestamp is None else timestamp
         
         with self._lock:
             # Record the request timestamp for both per-second and per-hour tracking
             self._request_history[category]['second'].append(current_time)
             self._request_history[category]['hour'].append(current_time)
     
+    def record_requests(self, category: ApiCategory, count: int, timestamp: Optional[float] = None):
+        """
+        Record several API requests made at the same moment for the specified category.
+        
+        Equivalent to calling record_request count times, but fills the history in a
+        single deque extend per window. Useful for saturating a category in tests.
+        
+        Args:
+            category: The API category the requests belong to
+            count: Number of requests to record
+            timestamp: Unix timestamp to record (defaults to the current time)
+        """
+        if count <= 0:
+            return
+        current_time = time.time() if timestamp is None else timestamp
+        
+        with self._lock:
+            for history in self._request_history[category].values():
+                # Anything beyond maxlen would be discarded by the deque anyway
+                history.extend(repeat(current_time, min(count, history.maxlen)))
+    
+    def penalize(self, category: ApiCategory, retry_after: float):
+        """
+        Hold off all requests in a category after the server returned a rate limit error.
+        
+        Args:
+            category: The API category that was rate limited
+            retry_after: Seconds the server asked us to wait before retrying
+        """
+        self._buckets[category].penalize(retry_after)
+    
     def wait_if_needed(self, category: ApiCategory) -> float:
         """
         Check if we need to wait before making another request.
         
+        When no wait is needed a token is taken from the category's bucket, so this
+        should be called once right before each request is sent.
+        
         Args:
             category: The API category the request belongs to
             
@@ -123,9 +230,9 @@ class RateLimiter:
                 wait_time = max(0, 3600.0 - (current_time - oldest))
                 if wait_time > 0:
                     return wait_time
-                
-            # No wait needed
-            return 0
+            
+            # Finally take a token, which also honours any server-imposed back-off
+            return self._buckets[category].acquire()
     
     def get_category_for_endpoint(self, endpoint: str) -> ApiCategory:
         """
@@ -140,10 +247,8 @@ class RateLimiter:
         # Classify the endpoint into a category based on the URL
         endpoint = endpoint.lstrip('/')
         
-        # Market data calls
-        if (endpoint.startswith('v1/markets') or 
-            endpoint.startswith('v1/symbols') or 
-            (endpoint.startswith('v1/symbols/') and '/options' in endpoint)):
+        # Market data calls (including symbol option chains)
+        if endpoint.startswith(('v1/markets', 'v1/symbols')):
             return ApiCategory.MARKET
         
         # Account calls (includes time endpoint)
@@ -13,7 +13,7 @@ from .CustomWrapper import (
     QuestradeRateLimitError
 )
 
-from .RateLimiter import RateLimiter, ApiCategory
+from .RateLimiter import RateLimiter, TokenBucket, ApiCategory
 from .enums import *
 from .Chronos import Chronos
 
@@ -24,6 +24,7 @@ __all__ = [
     'QuestradeOrderError',
     'QuestradeRateLimitError',
     'RateLimiter',
+    'TokenBucket',
     'ApiCategory',
     'Chronos'
 ] 
\ No newline at end of file
@@ -0,0 +1,19 @@
+"""
+Shared objects for the example and verification scripts.
+"""
+
+from functools import lru_cache
+
+from QuestradeAPI import QuestradeAPI, Chronos
+
+
+@lru_cache(maxsize=1)
+def get_chronos():
+    """
+    Create the QuestradeAPI client and Chronos instance once per process.
+
+    Returns:
+        tuple: (Chronos, QuestradeAPI)
+    """
+    api = QuestradeAPI()
+    return Chronos(api=api), api
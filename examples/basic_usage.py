@@ -3,32 +3,79 @@
 Basic usage example for the Questrade Custom API Wrapper
 """
 
+import asyncio
 import os
+from functools import partial
 from QuestradeAPI import QuestradeAPI
 
-def main():
+
+async def fetch_account_bundle(api, account_id):
     """
-    Demonstrates basic usage of the Questrade API wrapper.
+    Fetch positions and balances for an account concurrently.
+    
+    The wrapper is synchronous, so each call runs in the default executor and
+    the requests overlap instead of waiting on each other. Sharing one client
+    between the executor threads is safe: if the access token expires, only one
+    thread refreshes it and the others reuse the new token.
+    
+    Args:
+        api: An authenticated QuestradeAPI instance
+        account_id: Account number
+        
+    Returns:
+        Tuple of (positions, balances) responses
     """
-    # You can provide a refresh token directly or store it in a file
-    refresh_token = os.environ.get('QUESTRADE_REFRESH_TOKEN')
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, api.get_account_positions, account_id),
+        loop.run_in_executor(None, api.get_account_balances, account_id)
+    )
+
+
+async def fetch_symbol_bundle(api, symbol_id):
+    """
+    Fetch the quote and January 2023 daily candles for a symbol concurrently.
     
-    # Initialize the API with the refresh token
-    api = QuestradeAPI(refresh_token=refresh_token)
+    Args:
+        api: An authenticated QuestradeAPI instance
+        symbol_id: Symbol ID
+        
+    Returns:
+        Tuple of (quote, candles) responses
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(
+        loop.run_in_executor(None, api.get_quote, symbol_id),
+        loop.run_in_executor(None, partial(
+            api.get_candles,
+            symbol_id=symbol_id,
+            start_time="2023-01-01T00:00:00-05:00",
+            end_time="2023-01-31T00:00:00-05:00",
+            interval="OneDay"
+        ))
+    )
+
+
+async def run(api):
+    """
+    Run the example against an authenticated API instance.
     
+    Args:
+        api: An authenticated QuestradeAPI instance
+    """
     # Get account information
     accounts = api.get_accounts()
     print(f"Found {len(accounts['accounts'])} accounts:")
     
-    for account in accounts['accounts']:
+    # Positions and balances have no dependencies on each other, so fetch every
+    # account's bundle at once and print the results in account order
+    bundles = await asyncio.gather(
+        *(fetch_account_bundle(api, account['number']) for account in accounts['accounts'])
+    )
+    
+    for account, (positions, balances) in zip(accounts['accounts'], bundles):
         print(f"  - {account['type']} ({account['number']})")
-        
-        # Get account positions
-        positions = api.get_account_positions(account['number'])
         print(f"    Positions: {len(positions['positions'])}")
-        
-        # Get account balances
-        balances = api.get_account_balances(account['number'])
         print(f"    CAD Balance: {balances['perCurrencyBalances'][0]['cash']}")
         
     # Search for a symbol
@@ -40,19 +87,24 @@ def main():
         symbol_id = symbol['symbolId']
         print(f"  Symbol ID for {symbol['symbol']}: {symbol_id}")
         
-        # Get quote for the symbol
-        quote = api.get_quote(symbol_id)
+        # Get quote and candles for the symbol
+        quote, candles = await fetch_symbol_bundle(api, symbol_id)
         print(f"  Current price: ${quote['quotes'][0]['lastTradePrice']}")
-        
-        # Get candles for the symbol
-        candles = api.get_candles(
-            symbol_id=symbol_id,
-            start_time="2023-01-01T00:00:00-05:00",
-            end_time="2023-01-31T00:00:00-05:00",
-            interval="OneDay"
-        )
         print(f"  Candles: {len(candles['candles'])}")
         print(f"  First candle: {candles['candles'][0]['start']} - Open: ${candles['candles'][0]['open']}, Close: ${candles['candles'][0]['close']}")
 
+
+def main():
+    """
+    Demonstrates basic usage of the Questrade API wrapper.
+    """
+    # You can provide a refresh token directly or store it in a file
+    refresh_token = os.environ.get('QUESTRADE_REFRESH_TOKEN')
+    
+    # Initialize the API with the refresh token
+    api = QuestradeAPI(refresh_token=refresh_token)
+    
+    asyncio.run(run(api))
+
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
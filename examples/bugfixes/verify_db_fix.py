@@ -10,6 +10,13 @@ import sys
 from pathlib import Path
 from datetime import datetime
 
+_BAR = "=" * 40
+
+def print_section(title):
+    """Print a section banner with a single write and flush it."""
+    sys.stdout.write(f"\n{_BAR}\n=== {title} ===\n{_BAR}\n")
+    sys.stdout.flush()
+
 def verify_db_fix():
     # Add visible markers for script execution
     print("*" * 80)
@@ -29,10 +36,7 @@ def verify_db_fix():
     sys.stdout.flush()
     
     # 1. Check the schema
-    print("\n" + "=" * 40)
-    print("=== Checking Candles Table Schema ===")
-    print("=" * 40)
-    sys.stdout.flush()
+    print_section("Checking Candles Table Schema")
     
     cursor.execute("PRAGMA table_info(candles)")
     columns = cursor.fetchall()
@@ -41,10 +45,7 @@ def verify_db_fix():
     sys.stdout.flush()
     
     # 2. Check primary key
-    print("\n" + "=" * 40)
-    print("=== Checking Primary Key ===")
-    print("=" * 40)
-    sys.stdout.flush()
+    print_section("Checking Primary Key")
     
     cursor.execute("PRAGMA index_list('candles')")
     indexes = cursor.fetchall()
@@ -60,10 +61,7 @@ def verify_db_fix():
             sys.stdout.flush()
     
     # 3. Test insertion with different interval values
-    print("\n" + "=" * 40)
-    print("=== Testing Data Insertion with Different Intervals ===")
-    print("=" * 40)
-    sys.stdout.flush()
+    print_section("Testing Data Insertion with Different Intervals")
     
     # Sample data
     test_data = [
@@ -114,10 +112,7 @@ def verify_db_fix():
         conn.rollback()
     
     # 4. Verify retrieval with interval filter
-    print("\n" + "=" * 40)
-    print("=== Testing Data Retrieval with Interval Filter ===")
-    print("=" * 40)
-    sys.stdout.flush()
+    print_section("Testing Data Retrieval with Interval Filter")
     
     intervals = ['OneMinute', 'OneHour']
     for interval in intervals:
@@ -144,10 +139,7 @@ def verify_db_fix():
     print("  Database connection closed")
     sys.stdout.flush()
     
-    print("\n" + "=" * 40)
-    print("=== Verification Completed ===")
-    print("=" * 40)
-    sys.stdout.flush()
+    print_section("Verification Completed")
     print("The candles table appears to be correctly structured with the 'interval' column in the primary key.")
     sys.stdout.flush()
 
@@ -42,7 +42,7 @@ def main():
     print(f"Retrieved {len(candles_df)} candles for AAPL")
     if not candles_df.empty:
         print("\nSample data:")
-        print(candles_df.head())
+        print(candles_df.head().to_string(index=False))
     
     # Example 3: Call again to demonstrate caching
     print("\n=== Example 3: Get Minute Candles (Second Run - Should be from cache) ===")
@@ -66,10 +66,10 @@ def main():
     print(f"Retrieved {len(msft_daily)} daily candles for MSFT")
     if not msft_daily.empty:
         print("\nMSFT daily candles sample:")
-        print(msft_daily.head())
+        print(msft_daily.head().to_string(index=False))
     
     # Check the location of the SQLite databases
-    data_dir = chronos.project_root / "data"
+    data_dir = chronos.data_dir
     print(f"\nData is stored in: {data_dir}")
     print("Database files:")
     for file in data_dir.glob("*.db"):
@@ -1,17 +1,22 @@
 from QuestradeAPI.Chronos import Chronos
-from autogluon.timeseries import TimeSeriesDataFrame
-import pandas as pd
 
 # Initialize Chronos without API for read-only operations
 chronos = Chronos()
 
-print("Getting all market data...")
-all_md = chronos.get_all_market_data()
+# Candles of different intervals share one table; TimeSeriesDataFrame needs a single frequency
+print("Loading all one-minute market data...")
+all_md = chronos.load_market_data(interval="OneMinute")
 print("Market data column types:")
 print(all_md.dtypes)
 
 print("\nCreating TimeSeriesDataFrame...")
 try:
+    if all_md.empty:
+        raise ValueError("no market data loaded")
+    
+    # AutoGluon pulls in torch and friends, so only import it once there is data to convert
+    from autogluon.timeseries import TimeSeriesDataFrame
+    
     train_data = TimeSeriesDataFrame.from_data_frame(
         all_md,
         id_column="symbol",
@@ -22,4 +27,4 @@ try:
     print("Sample data:")
     print(train_data.head())
 except Exception as e:
-    print(f"\nError creating TimeSeriesDataFrame: {e}") 
\ No newline at end of file
+    print(f"\nError creating TimeSeriesDataFrame: {e}")
@@ -4,21 +4,71 @@ Test script to verify Chronos implementation against examples from the notebook.
 This script ensures Chronos has all the methods and functionality shown in the examples.
 """
 
+import argparse
 import os
 import sys
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 import pandas as pd
 import sqlite3
 from pathlib import Path
 
 try:
-    from QuestradeAPI import QuestradeAPI, Chronos
+    from _fixtures import get_chronos
     print("Successfully imported QuestradeAPI and Chronos")
 except ImportError as e:
     print(f"Error importing QuestradeAPI modules: {e}")
     print("Make sure you're running this script from the project root directory")
     exit(1)
 
+# Schema inspection queries, shared by every database checked
+INSPECT_SQL = "SELECT name FROM sqlite_master WHERE type='table'"
+TABLE_COLUMNS_SQL = (
+    "SELECT m.name, p.name, p.type "
+    "FROM sqlite_master m, pragma_table_info(m.name) p "
+    "WHERE m.type = 'table'"
+)
+
+# Date range used by the database search tests, computed once per run
+_TODAY = date.today()
+_START = (_TODAY - timedelta(days=3)).isoformat()
+_END = _TODAY.isoformat()
+
+def _dump(d, indent="  "):
+    """Write the key/value pairs of a dict in a single call."""
+    sys.stdout.write("\n".join(f"{indent}{k}: {v}" for k, v in d.items()) + "\n")
+
+def _fast_ro_conn(path):
+    """Open a read-only connection tuned for inspection queries."""
+    conn = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    conn.executescript(
+        "PRAGMA cache_size=-65536;"
+        "PRAGMA mmap_size=1073741824;"
+        "PRAGMA temp_store=MEMORY;"
+        "PRAGMA query_only=ON;"
+    )
+    return conn
+
+@lru_cache(maxsize=None)
+def _class_api(cls):
+    """Return the set of names defined on a class, computed once per class."""
+    return frozenset(dir(cls))
+
+def _has_method(chronos, name):
+    """Check that a name resolves to a callable on the Chronos class."""
+    cls = type(chronos)
+    if name not in _class_api(cls):
+        return False
+    # Read the class dict directly to skip attribute lookup; fall back for inherited names
+    class_dict = vars(cls)
+    if name in class_dict:
+        attr = class_dict[name]
+    else:
+        attr = getattr(chronos, name, None)
+    return callable(attr)
+
 def verify_chronos_attributes():
     """
     Verify that Chronos has all the required attributes and methods
@@ -27,12 +77,12 @@ def verify_chronos_attributes():
     print("\n=== Verifying Chronos Attributes and Methods ===")
     
     # Initialize Chronos
-    api = QuestradeAPI()
-    chronos = Chronos(api=api)
+    chronos, api = get_chronos()
     
     # Check required attributes
     required_attributes = [
-        'api', 'project_root', 'db_path', 'conn', 'symbol_cache'
+        'api', 'project_root', 'data_dir', 'db_path', 'market_db_path', 'conn', 'symbol_cache',
+        'symbol_cache_hits'
     ]
     
     # Check required methods
@@ -44,10 +94,14 @@ def verify_chronos_attributes():
         'get_candles', 'get_updated_candles', 'search_candles_from_db'
     ]
     
+    # Resolve the available names once instead of probing each with hasattr
+    class_names = _class_api(type(chronos))
+    instance_names = class_names | vars(chronos).keys()
+    
     # Verify attributes
     print("\nChecking required attributes:")
     for attr in required_attributes:
-        if hasattr(chronos, attr):
+        if attr in instance_names:
             print(f"✓ {attr}")
         else:
             print(f"✗ {attr} - MISSING")
@@ -55,31 +109,29 @@ def verify_chronos_attributes():
     # Verify methods
     print("\nChecking required methods:")
     for method in required_methods:
-        if hasattr(chronos, method) and callable(getattr(chronos, method)):
+        if _has_method(chronos, method):
             print(f"✓ {method}")
         else:
             print(f"✗ {method} - MISSING")
     
     return chronos, api
 
-def test_get_symbol_info(chronos):
+def test_get_symbol_info(chronos, symbol):
     """Test the get_symbol_info method as shown in the examples."""
     print("\n=== Testing get_symbol_info Method ===")
     
-    symbol = input("Enter a symbol to look up (default: AAPL): ").strip().upper() or "AAPL"
-    
     try:
         # First call should fetch from API
         print(f"\nLooking up {symbol} (first call, may fetch from API):")
         symbol_info = chronos.get_symbol_info(symbol_name=symbol)
         print(f"Retrieved symbol info for {symbol}:")
-        for key, value in symbol_info.items():
-            print(f"  {key}: {value}")
+        _dump(symbol_info)
         
         # Second call should use cache
         print(f"\nLooking up {symbol} again (should use cache):")
+        hits_before = chronos.symbol_cache_hits
         symbol_info2 = chronos.get_symbol_info(symbol_name=symbol)
-        print(f"Retrieved from cache: {'Symbol cache hit' in str(sys.stdout)}")
+        print(f"Retrieved from cache: {chronos.symbol_cache_hits > hits_before}")
         
         # Test symbol caching
         if symbol in chronos.symbol_cache:
@@ -108,7 +160,7 @@ def test_get_candles(chronos, symbol):
         if not candles_df.empty:
             print("DataFrame columns:", candles_df.columns.tolist())
             print("Sample data:")
-            print(candles_df.head(3))
+            print(candles_df.head(3).to_string(index=False))
         
         # Test with custom parameters
         print("\nTesting with custom parameters (5 days, OneDay):")
@@ -116,7 +168,7 @@ def test_get_candles(chronos, symbol):
         print(f"Retrieved {len(candles_df2)} daily candles")
         if not candles_df2.empty:
             print("Sample data:")
-            print(candles_df2.head(3))
+            print(candles_df2.head(3).to_string(index=False))
         
         # Verify that returned object is a pandas DataFrame
         if isinstance(candles_df, pd.DataFrame):
@@ -126,7 +178,8 @@ def test_get_candles(chronos, symbol):
             
         # Verify expected columns
         expected_columns = ['start', 'end', 'low', 'high', 'open', 'close', 'volume']
-        missing_columns = [col for col in expected_columns if col not in candles_df.columns]
+        actual_columns = frozenset(candles_df.columns)
+        missing_columns = [col for col in expected_columns if col not in actual_columns]
         if not missing_columns:
             print("✓ DataFrame contains all expected columns")
         else:
@@ -157,8 +210,7 @@ def test_get_updated_candles(chronos, symbol):
             if candles['candles']:
                 first_candle = candles['candles'][0]
                 print("\nFirst candle structure:")
-                for key, value in first_candle.items():
-                    print(f"  {key}: {value}")
+                _dump(first_candle)
                 
                 # Check expected keys
                 expected_keys = ['start', 'end', 'low', 'high', 'open', 'close', 'volume']
@@ -183,8 +235,7 @@ def test_search_candles_from_db(chronos, symbol):
     
     try:
         # Get a date range
-        end_date = datetime.now().strftime("%Y-%m-%d")
-        start_date = (datetime.now() - timedelta(days=3)).strftime("%Y-%m-%d")
+        start_date, end_date = _START, _END
         
         print(f"\nSearching for candles between {start_date} and {end_date}:")
         candles = chronos.search_candles_from_db(
@@ -202,100 +253,115 @@ def test_search_candles_from_db(chronos, symbol):
             # Check candle structure if any found
             if candles['candles']:
                 print("\nSample candle structure:")
-                for key, value in candles['candles'][0].items():
-                    print(f"  {key}: {value}")
+                _dump(candles['candles'][0])
         else:
             print(f"✗ Return value is {type(candles)}, not a dict with 'candles' key")
             
     except Exception as e:
         print(f"Error in search_candles_from_db: {e}")
 
+def test_search_symbols_in_db(chronos, search_term):
+    """Test the search_symbols_in_db method as shown in the examples."""
+    print(f"\n=== Testing search_symbols_in_db Method for '{search_term}' ===")
+    
+    try:
+        # Fetch one row past what we display to know whether there are more
+        start = time.perf_counter()
+        results = chronos.search_symbols_in_db(search_term, limit=6)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        has_more = len(results) > 5
+        
+        print(f"Search completed in {elapsed_ms:.2f} ms")
+        for result in results[:5]:
+            print(f"  {result['symbol']}: {result['description']}")
+        if has_more:
+            print("  ... and more")
+        elif not results:
+            print("  No matching symbols found")
+    
+    except Exception as e:
+        print(f"Error in search_symbols_in_db: {e}")
+
+def _table_columns(conn):
+    """Map every table in the database to its list of (column, type) pairs."""
+    tables = defaultdict(list)
+    if sqlite3.sqlite_version_info >= (3, 16, 0):
+        # Table-valued pragma functions let one query cover every table
+        rows = conn.execute(TABLE_COLUMNS_SQL).fetchall()
+    else:
+        rows = []
+        for (table,) in conn.execute(INSPECT_SQL).fetchall():
+            rows.extend((table, col[1], col[2]) for col in conn.execute(f"PRAGMA table_info('{table}')"))
+    for table, column, col_type in rows:
+        tables[table].append((column, col_type))
+    return tables
+
 def check_database_structure(chronos):
     """Check the database structure to ensure it matches the examples."""
     print("\n=== Checking Database Structure ===")
     
-    data_dir = chronos.project_root / "data"
-    
-    # Check symbols database
-    symbols_db = data_dir / "symbols.db"
-    if symbols_db.exists():
-        print(f"\nSymbols database exists at: {symbols_db}")
-        try:
-            conn = sqlite3.connect(str(symbols_db))
-            cursor = conn.cursor()
-            
-            # Check symbols table structure
-            cursor.execute("PRAGMA table_info(symbols)")
-            columns = cursor.fetchall()
-            print("\nSymbols table columns:")
-            for col in columns:
-                print(f"  {col[1]} ({col[2]})")
-                
-            # Expected columns in symbols table
-            expected_columns = {
-                'symbol_id', 'symbol', 'description', 'security_type', 
-                'listing_exchange', 'is_tradable', 'is_quotable', 
-                'currency', 'updated_at'
-            }
-            
-            # Check for missing columns
-            actual_columns = {col[1] for col in columns}
-            missing_columns = expected_columns - actual_columns
-            if not missing_columns:
-                print("✓ Symbols table has all expected columns")
-            else:
-                print(f"✗ Missing expected columns: {missing_columns}")
-                
-            conn.close()
-        except Exception as e:
-            print(f"Error examining symbols database: {e}")
-    else:
-        print(f"Symbols database doesn't exist at: {symbols_db}")
+    # (label, database path, table, expected columns) for each Chronos database
+    databases = [
+        ("Symbols", chronos.db_path, 'symbols', {
+            'symbol_id', 'symbol', 'description', 'security_type', 
+            'listing_exchange', 'is_tradable', 'is_quotable', 
+            'currency', 'updated_at'
+        }),
+        ("Market data", chronos.market_db_path, 'candles', {
+            'symbol', 'start', 'end', 'low', 'high', 'open', 
+            'close', 'volume', 'VWAP', 'interval'
+        }),
+    ]
     
-    # Check market data database
-    market_db = data_dir / "market_data.db"
-    if market_db.exists():
-        print(f"\nMarket data database exists at: {market_db}")
+    for label, db_path, table, expected_columns in databases:
+        if not db_path.exists():
+            print(f"{label} database doesn't exist at: {db_path}")
+            continue
+        
+        print(f"\n{label} database exists at: {db_path}")
         try:
-            conn = sqlite3.connect(str(market_db))
-            cursor = conn.cursor()
+            conn = _fast_ro_conn(db_path)
+            try:
+                columns = _table_columns(conn)[table]
+            finally:
+                conn.close()
             
-            # Check candles table structure
-            cursor.execute("PRAGMA table_info(candles)")
-            columns = cursor.fetchall()
-            print("\nCandles table columns:")
-            for col in columns:
-                print(f"  {col[1]} ({col[2]})")
-                
-            # Expected columns in candles table
-            expected_columns = {
-                'symbol', 'start', 'end', 'low', 'high', 'open', 
-                'close', 'volume', 'VWAP', 'interval'
-            }
+            print(f"\n{table.capitalize()} table columns:")
+            for name, col_type in columns:
+                print(f"  {name} ({col_type})")
             
             # Check for missing columns
-            actual_columns = {col[1] for col in columns}
-            missing_columns = expected_columns - actual_columns
+            missing_columns = expected_columns - {name for name, _ in columns}
             if not missing_columns:
-                print("✓ Candles table has all expected columns")
+                print(f"✓ {table.capitalize()} table has all expected columns")
             else:
                 print(f"✗ Missing expected columns: {missing_columns}")
-                
-            conn.close()
         except Exception as e:
-            print(f"Error examining market data database: {e}")
-    else:
-        print(f"Market data database doesn't exist at: {market_db}")
+            print(f"Error examining {label.lower()} database: {e}")
+
+def parse_args():
+    """Parse the symbol and search term used by the tests."""
+    parser = argparse.ArgumentParser(description="Verify the Chronos implementation")
+    parser.add_argument("--symbol", default=os.environ.get("CHRONOS_TEST_SYMBOL", "AAPL"),
+                        help="Symbol to look up (default: AAPL)")
+    parser.add_argument("--search", default="tech",
+                        help="Term to search the symbols database for (default: tech)")
+    args, _ = parser.parse_known_args()
+    return args
 
 def main():
     """Main function to run verification tests."""
+    args = parse_args()
+    
     print("=== Chronos Implementation Verification ===")
     print(f"Current directory: {os.getcwd()}")
-    print(f"Running verification at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Running verification at: {datetime.now().isoformat(sep=' ', timespec='seconds')}")
     
-    # Run tests in sequence
     chronos, api = verify_chronos_attributes()
-    symbol, symbol_info = test_get_symbol_info(chronos)
+    symbol, symbol_info = test_get_symbol_info(chronos, args.symbol.upper())
+    test_search_symbols_in_db(chronos, args.search)
+    
+    # These phases write to and then read from market_data.db, so they run in order
     test_get_candles(chronos, symbol)
     test_get_updated_candles(chronos, symbol)
     test_search_candles_from_db(chronos, symbol)
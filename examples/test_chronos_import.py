@@ -3,6 +3,7 @@
 Test script to verify that the Chronos class can be imported correctly.
 """
 
+import importlib.machinery
 import sys
 import os
 
@@ -21,19 +22,37 @@ try:
     print(f"QuestradeAPI package location: {QuestradeAPI.__module__}")
     
     # Create an instance to verify it works
-    api = QuestradeAPI()
-    chronos = Chronos(api=api)
-    print("\nSuccessfully created Chronos instance.")
-    print(f"Project root: {chronos.project_root}")
+    try:
+        from _fixtures import get_chronos
+    except ImportError as e:
+        # The helper lives next to this script, so this is not a Chronos import failure
+        print(f"\nCould not import the example fixtures: {e}")
+        print("Run this script from the examples directory")
+    else:
+        chronos, api = get_chronos()
+        print("\nSuccessfully created Chronos instance.")
+        print(f"Project root: {chronos.project_root}")
     
 except ImportError as e:
     print(f"\nImport error: {e}")
     
-    # Try to find the module
+    # Locate the package with the path finder; find_spec("QuestradeAPI.Chronos") would
+    # import the package again and fail the same way
     print("\nSearching for Chronos module...")
-    for path in sys.path:
-        chronos_path = os.path.join(path, "QuestradeAPI", "Chronos.py")
-        init_path = os.path.join(path, "QuestradeAPI", "__init__.py")
+    spec = importlib.machinery.PathFinder.find_spec("QuestradeAPI")
+    package_dirs = list(spec.submodule_search_locations or []) if spec else []
+    if not package_dirs:
+        print("  QuestradeAPI package not found")
+    
+    # Probe every sys.path entry only when asked to
+    if "--deep-search" in sys.argv:
+        package_dirs = [os.path.join(path, "QuestradeAPI") for path in sys.path]
+    else:
+        print("  Run with --deep-search to scan every sys.path entry")
+    
+    for package_dir in package_dirs:
+        chronos_path = os.path.join(package_dir, "Chronos.py")
+        init_path = os.path.join(package_dir, "__init__.py")
         
         if os.path.exists(chronos_path):
             print(f"  Found Chronos.py at: {chronos_path}")
@@ -45,6 +64,8 @@ except ImportError as e:
                         print(f"  __init__.py imports Chronos")
                     else:
                         print(f"  __init__.py DOES NOT import Chronos")
+        elif "--deep-search" not in sys.argv:
+            print(f"  Chronos.py not found in {package_dir}")
         
 except Exception as e:
     print(f"\nOther error: {e}")
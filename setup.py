@@ -1,17 +1,23 @@
+from pathlib import Path
 from setuptools import setup, find_packages
 
+long_description = (Path(__file__).parent / "README.md").read_text(encoding="utf-8")
+
 setup(
     name="questrade-custom-api",
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "requests",
-        "typing; python_version < '3.5'"
+        "requests>=2.25.0",
     ],
+    extras_require={
+        # Arrow-backed readers for Chronos.load_market_data; either engine is enough
+        "arrow": ["pandas>=2.0", "pyarrow", "duckdb", "adbc-driver-sqlite"],
+    },
     author="Questrade API Wrapper Developer",
     author_email="example@example.com",
     description="A custom wrapper for the Questrade API",
-    long_description=open("README.md").read(),
+    long_description=long_description,
     long_description_content_type="text/markdown",
     keywords="questrade, api, trading, finance",
     url="https://github.com/yourusername/QuestradeCustomAPIWrapper",
@@ -0,0 +1,112 @@
+"""
+Tests for token refreshes shared between clones, threads and processes.
+
+Run with: python -m unittest discover tests
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import requests
+
+from QuestradeAPI import QuestradeAPI
+
+from test_rate_limiter import FakeResponse
+
+
+class FakeTokenServer:
+    """Token endpoint that, like Questrade, accepts each refresh token only once."""
+
+    def __init__(self, first_token):
+        self.valid = {first_token}
+        self.issued = 0
+        self.lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        token = parse_qs(urlparse(url).query)['refresh_token'][0]
+        with self.lock:
+            if token not in self.valid:
+                return FakeResponse(400, payload={'error': 'invalid_grant'})
+            self.valid.remove(token)
+            self.issued += 1
+            new_token = f"r{self.issued + 1}"
+            self.valid.add(new_token)
+        return FakeResponse(200, payload={
+            'api_server': 'https://api01.iq.questrade.com/',
+            'access_token': f"a{self.issued}",
+            'token_type': 'Bearer',
+            'expires_in': 1800,
+            'refresh_token': new_token,
+        })
+
+
+class SharedAuthTest(unittest.TestCase):
+
+    def setUp(self):
+        self.token_path = os.path.join(tempfile.mkdtemp(), 'questrade_token.json')
+        with open(self.token_path, 'w') as f:
+            json.dump({'refresh_token': 'r1'}, f)
+        self.server = FakeTokenServer('r1')
+        patcher = mock.patch.object(requests.Session, 'get',
+                                    lambda session, url, **kwargs: self.server.get(url, **kwargs))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def saved_token(self):
+        with open(self.token_path) as f:
+            return json.load(f)['refresh_token']
+
+    def test_clone_then_original_reauthenticate(self):
+        api = QuestradeAPI(token_path=self.token_path)
+        clone = api.clone()
+
+        self.assertTrue(clone.authenticate())
+        self.assertTrue(api.authenticate())
+
+        self.assertEqual(api.refresh_token, self.saved_token())
+        self.assertEqual(api.access_token, clone.access_token)
+        self.assertEqual(self.server.issued, 3)
+
+    def test_stale_token_recovered_from_file(self):
+        # Two independent clients (e.g. two processes) sharing one token file
+        first = QuestradeAPI(token_path=self.token_path)
+        second = QuestradeAPI(token_path=self.token_path)  # Spends the token first just saved
+        self.assertTrue(first.authenticate())  # Its in-memory token is stale
+
+        self.assertTrue(os.path.exists(self.token_path))
+        self.assertEqual(first.refresh_token, self.saved_token())
+
+    def test_invalid_token_removes_file(self):
+        self.server.valid.clear()
+        api = QuestradeAPI(token_path=self.token_path)
+
+        self.assertIsNone(api.refresh_token)
+        self.assertFalse(os.path.exists(self.token_path))
+
+    def test_concurrent_reauthentication_refreshes_once(self):
+        api = QuestradeAPI(token_path=self.token_path)
+        stale = api.access_token
+        api.invalidate_token()
+        barrier = threading.Barrier(8)
+
+        def reauthenticate():
+            barrier.wait()
+            self.assertTrue(api._reauthenticate(stale))
+
+        threads = [threading.Thread(target=reauthenticate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(self.server.issued, 2)
+        self.assertEqual(api.refresh_token, self.saved_token())
+
+
+if __name__ == "__main__":
+    unittest.main()
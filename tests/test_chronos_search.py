@@ -0,0 +1,117 @@
+"""
+Tests for Chronos symbol search and the symbols_fts full-text index.
+
+Run with: python -m unittest discover tests
+"""
+
+import sqlite3
+import tempfile
+import unittest
+
+from QuestradeAPI import Chronos
+
+
+def has_fts5():
+    conn = sqlite3.connect(':memory:')
+    try:
+        conn.execute('CREATE VIRTUAL TABLE t USING fts5(x)')
+        return True
+    except sqlite3.OperationalError:
+        return False
+    finally:
+        conn.close()
+
+
+def make_symbol(symbol_id, symbol, description):
+    return {
+        'symbolId': symbol_id,
+        'symbol': symbol,
+        'description': description,
+        'securityType': 'Stock',
+        'listingExchange': 'NASDAQ',
+        'isTradable': True,
+        'isQuotable': True,
+        'currency': 'USD',
+    }
+
+
+class ChronosTestCase(unittest.TestCase):
+    """Chronos instance with a few symbols in a temporary project root."""
+
+    def setUp(self):
+        self.chronos = Chronos(project_root=tempfile.mkdtemp())
+        self.addCleanup(lambda: self.chronos.conn and self.chronos.conn.close())
+        self.chronos.bulk_insert_symbols([
+            make_symbol(1, 'AAPL', 'Apple Inc.'),
+            make_symbol(2, 'MSFT', 'Microsoft Corporation'),
+            make_symbol(3, 'AMZN', 'Amazon.com Inc.'),
+            make_symbol(4, 'GOOGL', 'Alphabet Inc. Class A'),
+        ], auto_fetch=False)
+
+    def search(self, term, **kwargs):
+        return [s['symbol'] for s in self.chronos.search_symbols_in_db(term, **kwargs)]
+
+
+class SymbolSearchTest(ChronosTestCase):
+
+    def test_substring_match_by_default(self):
+        self.assertEqual(self.search('PL'), ['AAPL'])
+        self.assertEqual(self.search('Inc'), ['AAPL', 'AMZN', 'GOOGL'])
+
+    def test_limit_and_offset_page_through_matches(self):
+        self.assertEqual(self.search('Inc', limit=2), ['AAPL', 'AMZN'])
+        self.assertEqual(self.search('Inc', limit=2, offset=2), ['GOOGL'])
+        self.assertEqual(self.search('Inc', offset=1), ['AMZN', 'GOOGL'])
+
+    def test_full_text_falls_back_without_index(self):
+        self.assertEqual(self.search('PL', full_text=True), ['AAPL'])
+        self.assertEqual(self.search('Inc', full_text=True, limit=1, offset=1), ['AMZN'])
+
+
+@unittest.skipUnless(has_fts5(), "SQLite was built without FTS5")
+class FullTextIndexTest(ChronosTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.chronos.optimize_db()
+
+    def assert_index_consistent(self):
+        # With rank=1 FTS5 also checks the index against the symbols table
+        self.chronos.conn.execute(
+            "INSERT INTO symbols_fts(symbols_fts, rank) VALUES ('integrity-check', 1)")
+
+    def test_full_text_matches_word_prefixes(self):
+        self.assertEqual(self.search('Micro', full_text=True), ['MSFT'])
+        self.assertEqual(self.search('PL', full_text=True), [])
+        self.assertEqual(self.search('Inc', full_text=True, limit=2, offset=1), ['AMZN', 'GOOGL'])
+
+    def test_insert_or_replace_drops_stale_entry(self):
+        # Same symbol under a new id replaces the old row through the UNIQUE constraint
+        self.chronos.bulk_insert_symbols([make_symbol(5, 'AAPL', 'Apple Computer')], auto_fetch=False)
+
+        self.assert_index_consistent()
+        self.assertEqual(self.search('Apple', full_text=True), ['AAPL'])
+        self.assertEqual(self.search('Computer', full_text=True), ['AAPL'])
+        rowids = [row[0] for row in self.chronos.conn.execute(
+            "SELECT rowid FROM symbols_fts WHERE symbols_fts MATCH 'Apple'")]
+        self.assertEqual(rowids, [5])
+
+    def test_update_reindexes_row(self):
+        with self.chronos.conn:
+            self.chronos.conn.execute(
+                "UPDATE symbols SET description = 'Meta Platforms' WHERE symbol = 'GOOGL'")
+
+        self.assert_index_consistent()
+        self.assertEqual(self.search('Meta', full_text=True), ['GOOGL'])
+        self.assertEqual(self.search('Alphabet', full_text=True), [])
+
+    def test_delete_removes_row(self):
+        with self.chronos.conn:
+            self.chronos.conn.execute("DELETE FROM symbols WHERE symbol = 'MSFT'")
+
+        self.assert_index_consistent()
+        self.assertEqual(self.search('Microsoft', full_text=True), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
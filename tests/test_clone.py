@@ -0,0 +1,37 @@
+"""
+Tests for QuestradeAPI.clone.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from QuestradeAPI import QuestradeAPI
+
+from test_rate_limiter import fake_authenticate
+
+
+class CloneTest(unittest.TestCase):
+
+    def setUp(self):
+        with mock.patch.object(QuestradeAPI, 'authenticate', fake_authenticate):
+            self.api = QuestradeAPI(refresh_token="refresh")
+
+    def test_overrides_apply_to_copy_only(self):
+        clone = self.api.clone(enforce_rate_limit=False)
+        self.assertFalse(clone.enforce_rate_limit)
+        self.assertTrue(self.api.enforce_rate_limit)
+        self.assertEqual(clone.access_token, self.api.access_token)
+
+    def test_unknown_attribute_rejected(self):
+        with self.assertRaises(TypeError):
+            self.api.clone(enforce_rate_limits=False)
+
+    def test_cache_dir_normalised(self):
+        self.assertEqual(self.api.clone(cache_dir=".cache").cache_dir, Path(".cache"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Tests for the on-disk response cache used by reference data endpoints.
+
+Run with: python -m unittest discover tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from QuestradeAPI import QuestradeAPI
+
+from test_rate_limiter import fake_authenticate
+
+
+class FileCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+        with mock.patch.object(QuestradeAPI, 'authenticate', fake_authenticate):
+            self.api = QuestradeAPI(refresh_token="refresh", cache_dir=self.cache_dir)
+        self.api._make_request = mock.Mock(side_effect=lambda *args, **kwargs: {'symbols': [args[0]]})
+        self.now = 1000.0
+        patcher = mock.patch('QuestradeAPI.CustomWrapper.time.time', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def cache_files(self):
+        return sorted((self.cache_dir / 'search_symbols').iterdir())
+
+    def test_call_styles_share_one_entry(self):
+        first = self.api.search_symbols("AAPL")
+        self.assertEqual(self.api.search_symbols(prefix="AAPL"), first)
+        self.assertEqual(self.api.search_symbols("AAPL", 0), first)
+        self.assertEqual(self.api._make_request.call_count, 1)
+        self.assertEqual(len(self.cache_files()), 1)
+
+    def test_entry_expires_after_ttl(self):
+        self.api.get_quote(8049)
+        self.now += 59
+        self.api.get_quote(8049)
+        self.assertEqual(self.api._make_request.call_count, 1)
+
+        self.now += 2
+        self.api.get_quote(8049)
+        self.assertEqual(self.api._make_request.call_count, 2)
+
+    def test_corrupt_or_missing_entry_is_refetched(self):
+        self.api.search_symbols("AAPL")
+        [cache_file] = self.cache_files()
+
+        cache_file.write_text('{"_cached_at": ')
+        self.assertEqual(self.api.search_symbols("AAPL"), {'symbols': ['v1/symbols/search']})
+        self.assertEqual(self.api._make_request.call_count, 2)
+
+        cache_file.unlink()
+        self.api.search_symbols("AAPL")
+        self.assertEqual(self.api._make_request.call_count, 3)
+        self.assertEqual(json.loads(cache_file.read_text())['_cached_at'], self.now)
+
+    def test_entry_written_through_temporary_file(self):
+        with mock.patch('QuestradeAPI.CustomWrapper.os.replace', wraps=os.replace) as replace:
+            self.api.search_symbols("AAPL")
+
+        [cache_file] = self.cache_files()
+        replace.assert_called_once()
+        tmp_file, target = replace.call_args.args
+        self.assertEqual(Path(target), cache_file)
+        self.assertEqual(Path(tmp_file).parent, cache_file.parent)
+        self.assertFalse(Path(tmp_file).exists())
+
+    def test_no_cache_dir_passes_through(self):
+        api = self.api.clone(cache_dir=None)
+        api.search_symbols("AAPL")
+        api.search_symbols("AAPL")
+        self.assertEqual(api._make_request.call_count, 2)
+        self.assertFalse((self.cache_dir / 'search_symbols').exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
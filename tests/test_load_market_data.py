@@ -0,0 +1,56 @@
+"""
+Tests for Chronos.load_market_data.
+
+Run with: python -m unittest discover tests
+"""
+
+import sqlite3
+import tempfile
+import unittest
+
+from QuestradeAPI import Chronos
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+@unittest.skipIf(pandas is None, "pandas is not installed")
+class LoadMarketDataTest(unittest.TestCase):
+
+    def setUp(self):
+        self.chronos = Chronos(project_root=tempfile.mkdtemp())
+        conn = sqlite3.connect(str(self.chronos.market_db_path))
+        with conn:
+            conn.execute('''
+            CREATE TABLE candles (
+                symbol TEXT, start TEXT, end TEXT, low REAL, high REAL, open REAL,
+                close REAL, volume INTEGER, VWAP REAL, interval TEXT,
+                PRIMARY KEY (symbol, start, interval)
+            )''')
+            conn.executemany('INSERT INTO candles VALUES (?, ?, ?, 1, 2, 1, 2, 100, 1.5, ?)', [
+                ('AAPL', '2024-01-02T09:30:00.000000-05:00', '2024-01-02T09:31:00.000000-05:00', 'OneMinute'),
+                ('AAPL', '2024-01-02T00:00:00.000000-05:00', '2024-01-03T00:00:00.000000-05:00', 'OneDay'),
+                ('MSFT', '2024-01-02T09:30:00.000000-05:00', '2024-01-02T09:31:00.000000-05:00', 'OneMinute'),
+            ])
+        conn.close()
+
+    def test_all_intervals_by_default(self):
+        df = self.chronos.load_market_data()
+        self.assertEqual(len(df), 3)
+        self.assertEqual(list(df.columns), list(Chronos.MARKET_DATA_COLUMNS))
+
+    def test_interval_filter(self):
+        df = self.chronos.load_market_data(interval='OneMinute')
+        self.assertEqual(list(df['symbol']), ['AAPL', 'MSFT'])
+        self.assertEqual(str(df['start'].iloc[0]), '2024-01-02 14:30:00')
+
+    def test_quoted_column_names(self):
+        df = self.chronos.load_market_data(columns=['symbol', 'end'], interval='OneDay')
+        self.assertEqual(df.to_dict('records')[0]['symbol'], 'AAPL')
+        self.assertEqual(str(df['end'].iloc[0]), '2024-01-03 05:00:00')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+"""
+Tests for rate limit handling in the rate limiter and QuestradeAPI._make_request.
+
+Run with: python -m unittest discover tests
+"""
+
+import unittest
+from unittest import mock
+
+from QuestradeAPI import QuestradeAPI, QuestradeRateLimitError
+from QuestradeAPI.RateLimiter import ApiCategory, RateLimiter, TokenBucket
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code, headers=None, payload=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._payload = payload if payload is not None else {}
+        self.text = str(self._payload)
+
+    def json(self):
+        return self._payload
+
+
+def fake_authenticate(api):
+    api.api_server = "https://api01.iq.questrade.com/"
+    api.access_token = "token"
+    api.token_type = "Bearer"
+    api._needs_reauth = False
+    return True
+
+
+class TokenBucketTest(unittest.TestCase):
+
+    def setUp(self):
+        self.now = 1000.0
+        patcher = mock.patch('QuestradeAPI.RateLimiter.time.monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_penalize_leaves_one_token_after_back_off(self):
+        bucket = TokenBucket(capacity=20, rate=20)
+        bucket.penalize(0.05)
+        self.assertAlmostEqual(bucket.acquire(), 0.05)
+        self.now += 0.05
+        self.assertEqual(bucket.acquire(), 0)
+        self.assertAlmostEqual(bucket.acquire(), 1 / 20)
+
+    def test_wait_if_needed_free_after_penalty(self):
+        limiter = RateLimiter()
+        limiter.penalize(ApiCategory.ACCOUNT, 0.05)
+        self.assertGreater(limiter.wait_if_needed(ApiCategory.ACCOUNT), 0)
+        self.now += 0.05
+        self.assertEqual(limiter.wait_if_needed(ApiCategory.ACCOUNT), 0)
+
+
+@mock.patch.object(QuestradeAPI, 'authenticate', fake_authenticate)
+class MakeRequestRateLimitTest(unittest.TestCase):
+
+    def make_api(self, responses, max_retries=3):
+        api = QuestradeAPI(refresh_token="refresh", max_retries=max_retries)
+        api.session.request = mock.Mock(side_effect=responses)
+        return api
+
+    def test_each_429_uses_one_retry(self):
+        too_many = FakeResponse(429, headers={'Retry-After': '0.05'})
+        api = self.make_api([too_many, too_many, FakeResponse(200, payload={'time': 'now'})])
+
+        self.assertEqual(api.get_time(), {'time': 'now'})
+        self.assertEqual(api.session.request.call_count, 3)
+
+    def test_429_raises_after_max_retries(self):
+        too_many = FakeResponse(429, headers={'Retry-After': '0.01'})
+        api = self.make_api([too_many] * 3, max_retries=2)
+
+        with self.assertRaises(QuestradeRateLimitError) as ctx:
+            api.get_time()
+        self.assertEqual(ctx.exception.code, "1006")
+        self.assertEqual(api.session.request.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()